@@ -1300,38 +1300,24 @@ class DigitalSignageClient:
                                 break
                             await asyncio.sleep(1)
                     else:
-                        # ANTI-FLICKER: Update status screen every 10 seconds (was 5s, was 3s before that)
-                        # This dramatically reduces flickering by minimizing screen refreshes
-                        # Users don't need second-by-second countdown updates - 10s intervals are fine
-                        update_interval = 10
-
-                        for remaining in range(retry_delay, 0, -1):
-                            # CRITICAL FIX: Check if connection was re-established during wait
-                            if self.stop_reconnection or self.connected:
-                                logger.info("Connection established during wait period - stopping reconnection")
-                                break
-
-                            # ANTI-FLICKER: Update status screen much less frequently
-                            # Only update on: first second, every 10 seconds, and last second
-                            # This prevents rapid screen redraws that cause flickering
-                            should_update = (
-                                remaining == retry_delay or  # First second
-                                remaining % update_interval == 0 or  # Every 10 seconds
-                                remaining <= 3  # Last 3 seconds (3, 2, 1)
+                        # Countdown updates only touch the countdown label (the status screen
+                        # diffs every update), so the screen can count down once per second
+                        if self.display_renderer:
+                            completed = await self.display_renderer.status_screen_manager.show_server_offline_async(
+                                server_url=server_url,
+                                attempt=attempt,
+                                retry_in=retry_delay,
+                                auto_discovery_active=self.config.auto_discover,
+                                should_stop=lambda: self.stop_reconnection or self.connected
                             )
-
-                            if should_update:
-                                if self.display_renderer and not self.config.show_cached_layout_on_disconnect:
-                                    # Use show_server_offline with countdown
-                                    self.display_renderer.status_screen_manager.show_server_offline(
-                                        server_url=server_url,
-                                        attempt=attempt,
-                                        retry_in=remaining,
-                                        auto_discovery_active=self.config.auto_discover
-                                    )
-                                    logger.debug(f"Updated server offline countdown: {remaining}s remaining")
-
-                            await asyncio.sleep(1)
+                            if not completed:
+                                logger.info("Connection established during wait period - stopping reconnection")
+                        else:
+                            for remaining in range(retry_delay, 0, -1):
+                                if self.stop_reconnection or self.connected:
+                                    logger.info("Connection established during wait period - stopping reconnection")
+                                    break
+                                await asyncio.sleep(1)
 
             if self.connected:
                 logger.info("Reconnection successful")
@@ -1608,6 +1594,13 @@ class DigitalSignageClient:
         # Stop reconnection if in progress
         self.stop_reconnection = True
 
+        # Release status screen window
+        if self.display_renderer and self.display_renderer.status_screen_manager:
+            try:
+                self.display_renderer.status_screen_manager.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down status screen: {e}")
+
         # Disconnect WebSocket
         self.disconnect_websocket()
 
@@ -4,32 +4,82 @@ Displays visual feedback while waiting for layouts or during connection states
 
 REDESIGNED ARCHITECTURE (2025):
 - EXACTLY 4 screens with proper state machine
-- Thread-safe state transitions with locks
+- Thread-safe state transitions, always applied on the Qt main thread
 - QR codes on all screens with relevant information
 - Professional, consistent design across all screens
 - NO race conditions - atomic state changes only
 """
 
+import asyncio
+import json
 import logging
-from typing import Optional, Dict, Any
-from io import BytesIO
-from datetime import datetime
+import os
+from collections import namedtuple
+from typing import Optional, Dict, Any, Callable
 import threading
+import time
 
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap, QFont, QColor, QPainter
-import qrcode
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QStackedWidget
+from PyQt5.QtCore import Qt, QEvent, QObject, QTimer, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QFont, QFontMetrics, QColor, QPainter
 
 # Import custom widgets
 from widgets import ScreenState, AnimatedDotsLabel, SpinnerWidget
 
 logger = logging.getLogger(__name__)
 
+# Fixed QR code mask pattern (0-7) - see StatusScreen._qr_matrix
+QR_MASK_PATTERN = 0
+
+# JSON separators without whitespace - every payload byte can raise the QR version
+QR_JSON_SEPARATORS = (',', ':')
+
+# Scaled font sizes (pt) and sizes/spacings (px) for the current resolution
+_Dims = namedtuple('_Dims', 'title subtitle body small icon qr spinner spacing large_spacing padding')
+
+
+class _UpdatesOff:
+    """Suspend painting of a widget while it is mutated - Qt repaints once on exit"""
+
+    def __init__(self, widget: QWidget):
+        self.widget = widget
+
+    def __enter__(self):
+        self.widget.setUpdatesEnabled(False)
+        return self.widget
+
+    def __exit__(self, exc_type, exc, tb):
+        # Re-enabling updates already schedules a repaint of the whole widget
+        self.widget.setUpdatesEnabled(True)
+        return False
+
+
+class _QrJob(QRunnable):
+    """Builds a QR code image in the QR thread pool and hands it to the screen"""
+
+    def __init__(self, screen: 'StatusScreen', data: bytes, size: int, background: int):
+        super().__init__()
+        self.screen = screen
+        self.data = data
+        self.size = size
+        self.background = background
+
+    def run(self):
+        image = StatusScreen._build_qr_image(self.data, self.size, self.background)
+        try:
+            # Queued to the GUI thread - the screen lives there
+            self.screen.qr_ready.emit(self.data, image)
+        except RuntimeError:
+            # Status screen deleted while the QR code was being generated
+            pass
+
 
 class StatusScreen(QWidget):
     """Main status screen widget - displays one of 4 possible states"""
 
+    # QR code image built in a worker thread: (payload, QImage or None)
+    qr_ready = pyqtSignal(bytes, object)
+
     # Color scheme
     COLOR_BACKGROUND = "#1a1a2e"
     COLOR_PRIMARY = "#4A90E2"
@@ -39,21 +89,76 @@ class StatusScreen(QWidget):
     COLOR_TEXT_PRIMARY = "#FFFFFF"
     COLOR_TEXT_SECONDARY = "#B0B0B0"
 
+    # PERFORMANCE: Colors used outside stylesheets, converted from the scheme once
+    QCOLOR_BACKGROUND = QColor(COLOR_BACKGROUND)
+    QR_BACKGROUND_RGB = QCOLOR_BACKGROUND.rgb()
+    QR_FOREGROUND_RGB = QColor(COLOR_TEXT_PRIMARY).rgb()
+
+    # Number of final QR code pixmaps kept for re-shown payloads
+    QR_PIXMAP_CACHE_SIZE = 8
+
+    # Smallest QR module size (px) - 1 px modules cannot be scanned from a distance
+    QR_MIN_MODULE_SIZE = 2
+
+    # Thread pool for QR code jobs - created on first use, see _qr_thread_pool()
+    _qr_pool = None
+
+    # Minimum time between two countdown label updates (ms)
+    COUNTDOWN_THROTTLE = 200
+
+    # Multi-line info texts - filled with a single format() per update
+    _TEXT_DISCOVERY_INFO = "Gerät: {}\nIP-Adresse: {}\nMAC-Adresse: {}"
+    _TEXT_DEVICE_INFO = "Gerät: {}\nIP-Adresse: {}"
+    _TEXT_NO_LAYOUT_INFO = "Client-ID: {}\nHostname: {}\nIP-Adresse: {}\nServer: {}"
+
+    # Label styles by object name: (font size from the scaled dimensions, bold, color rules).
+    # PERFORMANCE: Fonts are set as QFont objects and the rules go into a single
+    # stylesheet on the screen, so Qt parses one small sheet instead of one per label
+    _STYLES = {
+        'title_error': ('title', True, f"color: {COLOR_ERROR};"),
+        'title_primary': ('title', True, f"color: {COLOR_PRIMARY};"),
+        'title_warning': ('title', True, f"color: {COLOR_WARNING};"),
+        'subtitle_secondary': ('subtitle', False, f"color: {COLOR_TEXT_SECONDARY};"),
+        'subtitle_text': ('subtitle', False, f"color: {COLOR_TEXT_PRIMARY};"),
+        'subtitle_warning_bold': ('subtitle', True, f"color: {COLOR_WARNING};"),
+        'body_secondary': ('body', False, f"color: {COLOR_TEXT_SECONDARY};"),
+        'body_success': ('body', False, f"color: {COLOR_SUCCESS};"),
+        'body_text': ('body', False, f"color: {COLOR_TEXT_PRIMARY};"),
+        'small_secondary': ('small', False, f"color: {COLOR_TEXT_SECONDARY};"),
+        'instructions': ('body', False, (
+            f"color: {COLOR_TEXT_SECONDARY}; "
+            "background-color: #2A2A2A; padding: {padding}px; border-radius: 10px;"
+        )),
+    }
+
     def __init__(self, width: int = 1920, height: int = 1080, parent=None):
         super().__init__(parent)
         self.screen_width = width
         self.screen_height = height
         self.animated_widgets = []
-        self.current_layout = None
+        self._active_panel = None
+        self._icon_pixmaps = {}
+        self._restore_pending = False
+        self._qr_requests = {}
+        self._qr_pixmaps = {}
+
+        # Countdown updates arriving within COUNTDOWN_THROTTLE of the last one are
+        # collapsed into a single update with the latest value
+        self._pending_countdown = None
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setSingleShot(True)
+        self._countdown_timer.setInterval(self.COUNTDOWN_THROTTLE)
+        self._countdown_timer.timeout.connect(self._flush_countdown)
+        self.qr_ready.connect(self._on_qr_ready)
 
         self.setObjectName("status_screen")
         self.setFixedSize(width, height)
-        self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+
+        # PERFORMANCE: The background is filled once per repaint from the palette -
+        # no stylesheet background and no custom paintEvent painting it again
         self.setAutoFillBackground(True)
-        self.setStyleSheet(f"background-color: {self.COLOR_BACKGROUND};")
         palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor(self.COLOR_BACKGROUND))
+        palette.setColor(self.backgroundRole(), self.QCOLOR_BACKGROUND)
         self.setPalette(palette)
 
         # Hide cursor
@@ -61,95 +166,631 @@ class StatusScreen(QWidget):
 
         # Calculate scaled dimensions
         self._calculate_scaled_dimensions()
+        self.setStyleSheet(self._stylesheet)
 
-    def paintEvent(self, event):
-        """Ensure the background is always painted"""
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(self.COLOR_BACKGROUND))
-        super().paintEvent(event)
+        # PERFORMANCE: Build all screen panels once into a QStackedWidget - show_*
+        # only updates texts and switches pages instead of rebuilding a layout
+        self._build_panels()
 
     def _calculate_scaled_dimensions(self):
         """Calculate responsive dimensions based on screen resolution"""
-        self.title_font_size = int(self.screen_height * 0.05)
-        self.subtitle_font_size = int(self.screen_height * 0.035)
-        self.body_font_size = int(self.screen_height * 0.025)
-        self.small_font_size = int(self.screen_height * 0.018)
-        self.icon_font_size = int(self.screen_height * 0.12)
-
         min_dimension = min(self.screen_width, self.screen_height)
-        self.qr_size = int(min_dimension * 0.18)
 
-        self.spinner_size = int(self.screen_height * 0.10)
-        self.spacing = int(self.screen_height * 0.02)
-        self.large_spacing = int(self.screen_height * 0.035)
-        self.padding = int(self.screen_height * 0.015)
+        self.dims = _Dims(
+            title=int(self.screen_height * 0.05),
+            subtitle=int(self.screen_height * 0.035),
+            body=int(self.screen_height * 0.025),
+            small=int(self.screen_height * 0.018),
+            icon=int(self.screen_height * 0.12),
+            qr=int(min_dimension * 0.18),
+            spinner=int(self.screen_height * 0.10),
+            spacing=int(self.screen_height * 0.02),
+            large_spacing=int(self.screen_height * 0.035),
+            padding=int(self.screen_height * 0.015),
+        )
+
+        logger.debug("Status screen dimensions for %sx%s: %s", self.screen_width, self.screen_height, self.dims)
+
+        # PERFORMANCE: Build fonts and the stylesheet once - labels with the same
+        # style share the same QFont and are matched by their object name
+        sizes = self.dims._asdict()
+        fonts = {}
+        rules = []
+        self._fonts = {}
+        for name, (size, bold, template) in self._STYLES.items():
+            if (size, bold) not in fonts:
+                font = QFont()
+                font.setPointSize(sizes[size])
+                font.setBold(bold)
+                fonts[(size, bold)] = font
+            self._fonts[name] = fonts[(size, bold)]
+            rules.append(f"QLabel#{name} {{ {template.format(**sizes)} }}")
+        # Extra space above a widget, selected by its gap property (see _set_gap).
+        # A spacer item was followed by one more layout spacing - keep that distance.
+        for gap in ('spacing', 'large_spacing'):
+            rules.append(f'QLabel[gap="{gap}"] {{ margin-top: {sizes[gap] + self.dims.spacing}px; }}')
+        self._stylesheet = "\n".join(rules)
+
+    def _build_panels(self):
+        """Create the persistent stack with one page per screen"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._stack = QStackedWidget(self)
+        layout.addWidget(self._stack)
+
+        # Empty page shown while no status screen is active
+        self._blank_page = QWidget(self._stack)
+        self._stack.addWidget(self._blank_page)
+
+        # Animated widgets per panel - only the visible panel's are running
+        self._panel_animations = {}
+        self._spinners = {}
+        self._spinner_slots = {}
+
+        self._panel_auto_discovery = self._build_auto_discovery_panel()
+        self._panel_connecting = self._build_connecting_panel()
+        self._panel_no_layout = self._build_no_layout_panel()
+        self._panel_default = self._build_default_panel()
+        self._panel_connection_failed = self._build_connection_failed_panel()
+        self._panel_reconnecting = self._build_reconnecting_panel()
+        self._panel_server_offline = self._build_server_offline_panel()
+
+        for panel in (self._panel_auto_discovery, self._panel_connecting, self._panel_no_layout,
+                      self._panel_default, self._panel_connection_failed, self._panel_reconnecting,
+                      self._panel_server_offline):
+            self._stack.addWidget(panel)
+
+        for widgets in self._panel_animations.values():
+            for widget in widgets:
+                widget.cleanup()
+
+        # Panels with a retry countdown that update_countdown() can refresh alone
+        self._countdown_labels = {
+            self._panel_reconnecting: self._reconnecting_countdown_label,
+            self._panel_server_offline: self._offline_retry_label,
+        }
+
+    def _create_panel(self, animated_widgets: list):
+        """Create an empty panel widget with its own vertical layout"""
+        panel = QWidget(self)
+        layout = QVBoxLayout(panel)
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(self.dims.spacing)
+        self._panel_animations[panel] = animated_widgets
+        return panel, layout
+
+    def _add_label(self, layout, text: str, style: str, word_wrap: bool = False,
+                   static: bool = False, gap: str = '') -> QLabel:
+        """Add a centered label with a named style to a panel layout (gap: spacing name for extra space above it)"""
+        label = QLabel(text, layout.parentWidget())
+        label.setObjectName(style)
+        label.setFont(self._fonts[style])
+        label.setAlignment(Qt.AlignCenter)
+        label.setWordWrap(word_wrap)
+        if static:
+            self._mark_static(label)
+        if gap:
+            self._set_gap(label, gap)
+        layout.addWidget(label)
+        return label
+
+    def _set_gap(self, widget: QWidget, gap: str):
+        """Add space above a widget ('spacing' or 'large_spacing') instead of a spacer item
+
+        The margin comes from the screen stylesheet's gap rules - contents margins
+        would be reset when the stylesheet is polished.
+        """
+        widget.setProperty('gap', gap)
+
+    def _set_label_style(self, label: QLabel, style: str):
+        """Switch a label to another named style"""
+        label.setObjectName(style)
+        label.setFont(self._fonts[style])
+        # The stylesheet is only re-matched against the new object name on re-polish
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    def _mark_static(self, widget: QWidget):
+        """Keep the painted contents of a widget that never changes"""
+        # WA_OpaquePaintEvent is deliberately not set: QLabel does not fill its
+        # own background, so Qt would leave the area behind the text black
+        widget.setAttribute(Qt.WA_StaticContents, True)
+
+    def _render_icon_pixmap(self, glyph: str, color: str) -> QPixmap:
+        """Rasterize a large icon glyph once into a transparent pixmap"""
+        font = QFont()
+        font.setPointSize(self.dims.icon)
+        font.setBold(True)
+        metrics = QFontMetrics(font)
+
+        pixmap = QPixmap(metrics.horizontalAdvance(glyph), metrics.height())
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        return pixmap
+
+    def _add_icon(self, layout, glyph: str, color: str) -> QLabel:
+        """Add a centered icon label showing a cached glyph pixmap"""
+        key = (glyph, color)
+        if key not in self._icon_pixmaps:
+            self._icon_pixmaps[key] = self._render_icon_pixmap(glyph, color)
+
+        label = QLabel(layout.parentWidget())
+        label.setPixmap(self._icon_pixmaps[key])
+        label.setAlignment(Qt.AlignCenter)
+        self._mark_static(label)
+        layout.addWidget(label)
+        return label
+
+    def _add_spinner(self, layout, color: str, animated_widgets: list) -> SpinnerWidget:
+        """Add a horizontally centered spinner to a panel layout
+
+        PERFORMANCE: Panels share one spinner (and its pre-rendered frames) per
+        color - _show_panel moves it into the layout of the panel being shown
+        """
+        spinner = self._spinners.get(color)
+        if spinner is None:
+            spinner = self._spinners[color] = SpinnerWidget(self.dims.spinner, color)
+        self._spinner_slots[layout.parentWidget()] = (layout, layout.count(), spinner)
+        layout.addWidget(spinner, 0, Qt.AlignHCenter)
+        animated_widgets.append(spinner)
+        return spinner
+
+    def _add_dots_label(self, layout, text: str, style: str, animated_widgets: list) -> AnimatedDotsLabel:
+        """Add a centered label with animated dots to a panel layout"""
+        label = AnimatedDotsLabel(text, layout.parentWidget())
+        label.setObjectName(style)
+        label.setFont(self._fonts[style])
+        label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(label)
+        animated_widgets.append(label)
+        return label
+
+    def _add_qr_code(self, layout, caption: str, gap: str = ''):
+        """Add a QR code label plus caption to a panel layout (pixmap set per show)"""
+        qr_label = QLabel(layout.parentWidget())
+        qr_label.setAlignment(Qt.AlignCenter)
+        if gap:
+            self._set_gap(qr_label, gap)
+        layout.addWidget(qr_label)
+        caption_label = self._add_label(
+            layout, caption,
+            'small_secondary',
+            static=True
+        )
+        return qr_label, caption_label
+
+    def _build_auto_discovery_panel(self):
+        animated = []
+        panel, layout = self._create_panel(animated)
+
+        self._add_spinner(layout, self.COLOR_PRIMARY, animated)
+        self._add_dots_label(
+            layout, "Suche Digital Signage Server",
+            'title_primary',
+            animated
+        )
+        self._add_label(
+            layout, "Auto-Discovery Aktiv (mDNS + UDP Broadcast)",
+            'subtitle_text',
+            static=True
+        )
+        self._discovery_info_label = self._add_label(
+            layout, "", 'body_secondary',
+            gap='large_spacing'
+        )
+        self._discovery_qr_label, self._discovery_qr_caption = self._add_qr_code(
+            layout, "Geräte-Informationen (QR-Code scannen)",
+            gap='large_spacing'
+        )
+        return panel
+
+    def _build_connecting_panel(self):
+        animated = []
+        panel, layout = self._create_panel(animated)
+
+        self._add_spinner(layout, self.COLOR_PRIMARY, animated)
+        self._add_dots_label(
+            layout, "Verbindung wird hergestellt",
+            'title_primary',
+            animated
+        )
+        self._connecting_server_label = self._add_label(
+            layout, "", 'subtitle_text',
+            word_wrap=True
+        )
+        self._connecting_attempt_label = self._add_label(
+            layout, "", 'body_secondary'
+        )
+        self._connecting_info_label = self._add_label(
+            layout, "", 'body_secondary',
+            gap='large_spacing'
+        )
+        self._connecting_qr_label, self._connecting_qr_caption = self._add_qr_code(
+            layout, "Verbindungsinformationen (QR-Code scannen)",
+            gap='large_spacing'
+        )
+        return panel
+
+    def _build_no_layout_panel(self):
+        panel, layout = self._create_panel([])
+
+        self._add_icon(layout, "⚠", self.COLOR_WARNING)
+        self._add_label(
+            layout, "Kein Layout zugewiesen",
+            'title_warning',
+            static=True
+        )
+        self._add_label(
+            layout, "Dieses Gerät ist verbunden, aber es wurde noch kein Layout zugewiesen",
+            'subtitle_secondary',
+            word_wrap=True,
+            static=True
+        )
+        self._no_layout_info_label = self._add_label(
+            layout, "", 'body_secondary',
+            gap='large_spacing'
+        )
+
+        instructions = [
+            "Administrator-Anweisungen:",
+            "1. Am Digital Signage Management Server anmelden",
+            "2. Zu Geräteverwaltung navigieren",
+            "3. Dieses Gerät anhand der Client-ID oder IP-Adresse finden",
+            "4. Ein Layout diesem Gerät zuweisen"
+        ]
+        self._add_label(
+            layout, "\n".join(instructions), 'instructions',
+            gap='large_spacing'
+        )
+        self._no_layout_qr_label, self._no_layout_qr_caption = self._add_qr_code(
+            layout, "Geräteinformationen für Layout-Zuweisung (QR-Code scannen)",
+            gap='large_spacing'
+        )
+        return panel
+
+    def _build_default_panel(self):
+        animated = []
+        panel, layout = self._create_panel(animated)
+
+        self._add_spinner(layout, self.COLOR_PRIMARY, animated)
+        self._add_dots_label(
+            layout, "Verbindung wird hergestellt",
+            'title_primary',
+            animated
+        )
+
+        # Logo (if available)
+        logo_path = os.path.join(os.path.dirname(__file__), 'digisign-logo.png')
+        if os.path.exists(logo_path):
+            logo_label = QLabel(panel)
+            pixmap = QPixmap(logo_path)
+            # Scale to 30% of screen size
+            scaled = pixmap.scaled(
+                int(self.screen_width * 0.3),
+                int(self.screen_height * 0.3),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            logo_label.setPixmap(scaled)
+            logo_label.setAlignment(Qt.AlignCenter)
+            self._set_gap(logo_label, 'large_spacing')
+            layout.addWidget(logo_label)
+        return panel
+
+    def _build_connection_failed_panel(self):
+        panel, layout = self._create_panel([])
+
+        self._add_icon(layout, "✗", self.COLOR_ERROR)
+        self._add_label(
+            layout, "Verbindung fehlgeschlagen",
+            'title_error',
+            static=True
+        )
+        self._failed_error_label = self._add_label(
+            layout, "", 'subtitle_secondary',
+            word_wrap=True,
+            gap='spacing'
+        )
+        self._add_label(
+            layout, "Automatische Wiederverbindung läuft...",
+            'body_text',
+            static=True,
+            gap='large_spacing'
+        )
+        return panel
+
+    def _build_reconnecting_panel(self):
+        animated = []
+        panel, layout = self._create_panel(animated)
+
+        # Spinner (orange for reconnecting)
+        self._add_spinner(layout, self.COLOR_WARNING, animated)
+        self._add_dots_label(
+            layout, "Erneuter Verbindungsversuch",
+            'title_warning',
+            animated
+        )
+        self._reconnecting_attempt_label = self._add_label(
+            layout, "", 'subtitle_text',
+            gap='spacing'
+        )
+        self._reconnecting_countdown_label = self._add_label(
+            layout, "",
+            'subtitle_warning_bold'
+        )
+        return panel
+
+    def _build_server_offline_panel(self):
+        animated = []
+        panel, layout = self._create_panel(animated)
+
+        # Spinner (orange for warning)
+        self._add_spinner(layout, self.COLOR_WARNING, animated)
+        self._add_label(
+            layout, "Server Offline",
+            'title_warning',
+            static=True
+        )
+        self._offline_reconnect_label = self._add_dots_label(
+            layout, "Verbindung wird wiederhergestellt",
+            'subtitle_text',
+            animated
+        )
+        self._offline_server_label = self._add_label(
+            layout, "", 'body_secondary',
+            word_wrap=True,
+            gap='spacing'
+        )
+        self._offline_retry_label = self._add_label(
+            layout, "",
+            'subtitle_warning_bold'
+        )
+        self._offline_attempt_label = self._add_label(
+            layout, "", 'body_secondary'
+        )
+        self._offline_discovery_label = self._add_label(layout, "", 'body_secondary', gap='large_spacing')
+        self._offline_info_label = self._add_label(
+            layout, "", 'body_secondary'
+        )
+        self._add_label(
+            layout, "Automatische Wiederverbindung läuft\nKeine Aktion erforderlich",
+            'body_secondary',
+            static=True,
+            gap='spacing'
+        )
+        self._offline_qr_label, self._offline_qr_caption = self._add_qr_code(
+            layout, "Wiederverbindungsinformationen (QR-Code scannen)",
+            gap='large_spacing'
+        )
+        return panel
+
+    def _show_panel(self, panel):
+        """Switch the stack to the given panel and run its animations"""
+        if self._active_panel is panel:
+            return
+
+        self.clear_screen()
+
+        slot = self._spinner_slots.get(panel)
+        if slot is not None:
+            layout, index, spinner = slot
+            if spinner.parentWidget() is not panel:
+                layout.insertWidget(index, spinner, 0, Qt.AlignHCenter)
+                spinner.show()
+
+        for widget in self._panel_animations.get(panel, []):
+            widget.start()
+        self.animated_widgets = list(self._panel_animations.get(panel, []))
+
+        self._stack.setCurrentWidget(panel)
+        self._active_panel = panel
 
     def clear_screen(self):
-        """Clear all widgets from the screen"""
+        """Switch to the blank page and stop the active panel's animations"""
         for widget in self.animated_widgets:
             if hasattr(widget, 'cleanup'):
                 try:
                     widget.cleanup()
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup animated widget: {e}")
+                    logger.warning("Failed to cleanup animated widget: %s", e)
 
         self.animated_widgets.clear()
+        self._cancel_countdown()
 
-        if self.current_layout:
-            try:
-                for i in reversed(range(self.current_layout.count())):
-                    item = self.current_layout.takeAt(i)
-                    if item.widget():
-                        item.widget().deleteLater()
-            except Exception as e:
-                logger.warning(f"Failed to clear layout: {e}")
+        if self._active_panel is not None:
+            self._stack.setCurrentWidget(self._blank_page)
+            self._active_panel = None
 
-    def _create_layout(self):
-        """Create a new layout for content"""
-        if self.current_layout:
-            self.clear_screen()
+    @staticmethod
+    def _build_qr_image(data: bytes, size: int, background: int) -> Optional[QImage]:
+        """Build a QR code image (QImage only - safe to run in a worker thread)
 
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setSpacing(self.spacing)
-        self.current_layout = layout
-        return layout
+        Not cached here - re-shown payloads are served from the final pixmaps kept
+        in _qr_pixmaps, and a failed encode is retried the next time it is shown.
 
-    def _create_qr_code(self, data: str, size: int = 200) -> Optional[QLabel]:
-        """Create a QR code widget"""
+        PERFORMANCE: The module matrix is packed straight into a 1-bit QImage
+        instead of going through PIL, a PNG encode and a PNG decode. The payload
+        arrives already UTF-8 encoded, so the encoder takes it as-is without
+        re-encoding a string.
+        """
         try:
+            # Module matrix including the quiet zone border
+            matrix = StatusScreen._qr_matrix(data)
+            modules = len(matrix)
+            bytes_per_line = (modules + 31) // 32 * 4
+            padding = bytes_per_line * 8 - modules
+
+            bits = bytearray()
+            for row in matrix:
+                value = 0
+                for dark in row:
+                    value = (value << 1) | dark
+                bits += (value << padding).to_bytes(bytes_per_line, 'big')
+
+            image = QImage(bytes(bits), modules, modules, bytes_per_line, QImage.Format_Mono).copy()
+            image.setColor(0, background)
+            image.setColor(1, StatusScreen.QR_FOREGROUND_RGB)
+
+            # Whole-pixel module size landing closest to the target size - the code
+            # may end up slightly larger than size, the label grows with it.
+            # Nearest neighbour at an integer factor keeps every module edge sharp;
+            # a 1-bit matrix is never scaled by a non-integer factor.
+            box_size = max(StatusScreen.QR_MIN_MODULE_SIZE, round(size / modules))
+            return image.scaled(modules * box_size, modules * box_size, Qt.KeepAspectRatio, Qt.FastTransformation)
+
+        except ImportError:
+            logger.error("Neither segno nor qrcode module available - QR code not shown")
+            return None
+        except Exception as e:
+            logger.error("Failed to create QR code: %s", e)
+            return None
+
+    @staticmethod
+    def _qr_matrix(data: bytes) -> list:
+        """Encode a QR code into rows of dark (1) / light (0) modules with a 4 module border
+
+        PERFORMANCE: segno is used when installed - it encodes considerably faster
+        than qrcode's pure-Python mask search, which stays as the fallback.
+        The mask pattern is pinned, skipping the search for the best of the 8
+        masks (most of the encode time) - any mask gives a valid, scannable code,
+        the best one only evens out the dark/light distribution.
+        """
+        # Imported lazily: only needed once a screen with a QR code is actually shown
+        try:
+            import segno
+        except ImportError:
+            import qrcode
+
             qr = qrcode.QRCode(
                 version=1,
                 error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=10,
                 border=4,
+                mask_pattern=QR_MASK_PATTERN,
             )
             qr.add_data(data)
             qr.make(fit=True)
+            return qr.get_matrix()
+
+        qr = segno.make(data, error='m', micro=False, mask=QR_MASK_PATTERN)
+        return [list(row) for row in qr.matrix_iter(scale=1, border=4)]
 
-            img = qr.make_image(fill_color="white", back_color=self.COLOR_BACKGROUND)
+    @classmethod
+    def _qr_thread_pool(cls) -> QThreadPool:
+        """Thread pool running the QR code jobs
 
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            buffer.seek(0)
+        Not QThreadPool.globalInstance(): Qt's smooth image scaling (e.g. the logo)
+        splits its work onto the global pool and waits for it while the GUI thread
+        holds the GIL - a QR job queued there would deadlock waiting for the GIL.
+        """
+        if cls._qr_pool is None:
+            cls._qr_pool = QThreadPool()
+            cls._qr_pool.setMaxThreadCount(1)
+        return cls._qr_pool
+
+    @staticmethod
+    def _qr_pixmap_from_image(image: Optional[QImage]) -> Optional[QPixmap]:
+        """Convert a QR code image into a pixmap (GUI thread only)"""
+        if image is None:
+            return None
+        # Shown at its built size - downscaling would drop whole module rows
+        return QPixmap.fromImage(image)
 
-            pixmap = QPixmap()
-            if not pixmap.loadFromData(buffer.read()):
-                logger.error("Failed to load QR code image data")
-                return None
+    def _set_qr_code(self, qr_label: QLabel, caption_label: QLabel, data: str):
+        """Render the QR code into a panel's QR label (hidden if generation fails)
 
-            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        PERFORMANCE: The QR code is encoded in a worker thread, so the
+        screen's text appears without waiting for it. Payloads shown before are
+        set at once from the final pixmaps kept by _on_qr_ready.
+        """
+        # Encoded once: the bytes are the cache key and go straight into qrcode
+        data = data.encode('utf-8')
+
+        pixmap = self._qr_pixmaps.get(data)
+        if pixmap is not None:
+            self._qr_requests.pop(qr_label, None)
+            self._apply_qr_pixmap(qr_label, caption_label, pixmap)
+            return
+
+        self._qr_requests[qr_label] = (data, caption_label)
+        self._qr_thread_pool().start(_QrJob(self, data, self.dims.qr, self.QR_BACKGROUND_RGB))
+
+    def _on_qr_ready(self, data: bytes, image: Optional[QImage]):
+        """Show a finished QR code in every label still waiting for that payload"""
+        # Kept even if no label waits any more - the payload may be shown again
+        pixmap = self._qr_pixmap_from_image(image)
+        self._cache_qr_pixmap(data, pixmap)
+
+        for qr_label, (requested, caption_label) in list(self._qr_requests.items()):
+            # A newer show_* may have requested a different payload meanwhile
+            if requested != data:
+                continue
+            self._apply_qr_pixmap(qr_label, caption_label, pixmap)
+            del self._qr_requests[qr_label]
+
+    def _cache_qr_pixmap(self, data: bytes, pixmap: Optional[QPixmap]):
+        """Keep the final pixmap of a payload (oldest entry dropped beyond QR_PIXMAP_CACHE_SIZE)"""
+        if pixmap is None:
+            return
+        self._qr_pixmaps[data] = pixmap
+        if len(self._qr_pixmaps) > self.QR_PIXMAP_CACHE_SIZE:
+            del self._qr_pixmaps[next(iter(self._qr_pixmaps))]
+
+    def _apply_qr_pixmap(self, qr_label: QLabel, caption_label: QLabel, pixmap: Optional[QPixmap]):
+        """Show the pixmap in the QR label, or hide label and caption without one"""
+        if pixmap:
+            qr_label.setPixmap(pixmap)
+        qr_label.setVisible(pixmap is not None)
+        caption_label.setVisible(pixmap is not None)
+
+    def _present(self):
+        """Bring the status screen to the front
+
+        PERFORMANCE: No forced full-screen repaint - the page switch and the
+        setText calls already invalidate exactly the regions that changed
+        """
+        # The show_* call just set every label - a queued countdown would be stale
+        self._cancel_countdown()
+        self.ensure_visible()
 
-            label = QLabel(self)
-            label.setPixmap(pixmap)
-            label.setAlignment(Qt.AlignCenter)
+    def changeEvent(self, event):
+        """Restore fullscreen when the screen is minimized or leaves fullscreen while a panel is shown
 
-            buffer.close()
-            return label
+        Focus changes are deliberately ignored - a window the operator activates
+        (terminal, dialog) is not pulled back behind the status screen.
 
-        except Exception as e:
-            logger.error(f"Failed to create QR code: {e}")
-            return None
+        PERFORMANCE: Event driven - replaces polling the window state on a timer
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self._active_panel is not None and not self._restore_pending:
+                self._restore_pending = True
+                QTimer.singleShot(0, self._restore_fullscreen)
+
+    def _restore_fullscreen(self):
+        """Run the restore requested by changeEvent (coalesces bursts of window events)"""
+        self._restore_pending = False
+        if self._active_panel is not None and (self.isMinimized() or not self.isFullScreen()):
+            self.showFullScreen()
+            self.raise_()
+
+    def ensure_visible(self):
+        """Show the screen fullscreen and on top - skips calls that would change nothing
+
+        ANTI-FLICKER: Each of these calls is a round-trip to the window system
+        and queues events, so they are only made when actually needed
+        """
+        if not self.isVisible() or not self.isFullScreen():
+            self.showFullScreen()
+        if not self.isActiveWindow():
+            self.raise_()
+            self.activateWindow()
 
     def show_auto_discovery(self, device_info: Dict[str, Any]):
         """
@@ -157,92 +798,37 @@ class StatusScreen(QWidget):
         Shown during auto-discovery phase (searching for server via mDNS/UDP)
         QR code: Device info + search status
 
-        ANTI-FLICKER: Only recreates screen if device info actually changed
+        ANTI-FLICKER: Only updates screen if device info actually changed
         """
-        # ANTI-FLICKER FIX: Check if we need to recreate the screen
-        # Only recreate if device info changed (e.g., IP address changed)
-        if hasattr(self, '_last_auto_discovery_info'):
+        # ANTI-FLICKER FIX: Check if we need to update the screen
+        # Only update if device info changed (e.g., IP address changed)
+        if self._active_panel is self._panel_auto_discovery and hasattr(self, '_last_auto_discovery_info'):
             if self._last_auto_discovery_info == device_info:
-                logger.debug("Auto-discovery screen already showing with same info - skipping recreation to prevent flicker")
+                logger.debug("Auto-discovery screen already showing with same info - skipping update to prevent flicker")
                 return
 
-        # Store current info for next call
-        self._last_auto_discovery_info = device_info.copy() if device_info else {}
-
-        layout = self._create_layout()
-
-        # Spinner
-        spinner = SpinnerWidget(self.spinner_size, self.COLOR_PRIMARY, self)
-        spinner_container = QWidget()
-        spinner_layout = QHBoxLayout(spinner_container)
-        spinner_layout.addStretch()
-        spinner_layout.addWidget(spinner)
-        spinner_layout.addStretch()
-        layout.addWidget(spinner_container)
-        self.animated_widgets.append(spinner)
-
-        # Title with animated dots
-        title_label = AnimatedDotsLabel("Suche Digital Signage Server", self)
-        title_label.setStyleSheet(f"color: {self.COLOR_PRIMARY}; font-size: {self.title_font_size}pt; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-        self.animated_widgets.append(title_label)
-
-        # Subtitle
-        subtitle_label = QLabel("Auto-Discovery Aktiv (mDNS + UDP Broadcast)", self)
-        subtitle_label.setStyleSheet(f"color: {self.COLOR_TEXT_PRIMARY}; font-size: {self.subtitle_font_size}pt;")
-        subtitle_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(subtitle_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # Device info
-        device_info_text = [
-            f"Gerät: {device_info.get('Hostname', 'Unknown')}",
-            f"IP-Adresse: {device_info.get('IpAddress', 'Unknown')}",
-            f"MAC-Adresse: {device_info.get('MacAddress', 'Unknown')}"
-        ]
-        info_label = QLabel("\n".join(device_info_text), self)
-        info_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        info_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_label)
+        with _UpdatesOff(self):
+            # Store current info for next call
+            self._last_auto_discovery_info = device_info.copy() if device_info else {}
 
-        layout.addSpacing(self.large_spacing)
+            # Device info
+            self._discovery_info_label.setText(self._TEXT_DISCOVERY_INFO.format(
+                device_info.get('Hostname', 'Unknown'),
+                device_info.get('IpAddress', 'Unknown'),
+                device_info.get('MacAddress', 'Unknown')
+            ))
 
-        # QR Code with device info as JSON
-        try:
-            import json
+            # QR Code with device info as JSON
             qr_data = json.dumps({
                 "hostname": device_info.get('Hostname', 'Unknown'),
                 "ip": device_info.get('IpAddress', 'Unknown'),
                 "mac": device_info.get('MacAddress', 'Unknown'),
                 "status": "discovering"
-            }, indent=2)
-
-            qr_widget = self._create_qr_code(qr_data, self.qr_size)
-            if qr_widget:
-                layout.addWidget(qr_widget)
-                qr_label = QLabel("Geräte-Informationen (QR-Code scannen)", self)
-                qr_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.small_font_size}pt;")
-                qr_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(qr_label)
-        except Exception as e:
-            logger.warning(f"Failed to create QR code: {e}")
-
-        layout.addStretch()
+            }, separators=QR_JSON_SEPARATORS)
+            self._set_qr_code(self._discovery_qr_label, self._discovery_qr_caption, qr_data)
 
-        self.setLayout(layout)
-
-        # ANTI-FLICKER: Disable updates during layout setup
-        self.setUpdatesEnabled(False)
-        self.setLayout(layout)
-        self.setUpdatesEnabled(True)
-
-        # ANTI-FLICKER: Single update at the end
-        self.update()
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+            self._show_panel(self._panel_auto_discovery)
+        self._present()
 
         logger.info("STATUS SCREEN: Auto Discovery")
 
@@ -252,82 +838,30 @@ class StatusScreen(QWidget):
         Shown when connection is being established (after discovery OR with manual server)
         QR code: Server URL being connected to + device info
         """
-        layout = self._create_layout()
-
-        # Spinner
-        spinner = SpinnerWidget(self.spinner_size, self.COLOR_PRIMARY, self)
-        spinner_container = QWidget()
-        spinner_layout = QHBoxLayout(spinner_container)
-        spinner_layout.addStretch()
-        spinner_layout.addWidget(spinner)
-        spinner_layout.addStretch()
-        layout.addWidget(spinner_container)
-        self.animated_widgets.append(spinner)
-
-        # Title with animated dots
-        title_label = AnimatedDotsLabel("Verbindung wird hergestellt", self)
-        title_label.setStyleSheet(f"color: {self.COLOR_PRIMARY}; font-size: {self.title_font_size}pt; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-        self.animated_widgets.append(title_label)
-
-        # Server URL
-        server_label = QLabel(f"Server: {server_url}", self)
-        server_label.setStyleSheet(f"color: {self.COLOR_TEXT_PRIMARY}; font-size: {self.subtitle_font_size}pt;")
-        server_label.setAlignment(Qt.AlignCenter)
-        server_label.setWordWrap(True)
-        layout.addWidget(server_label)
-
-        # Attempt counter
-        attempt_label = QLabel(f"Verbindungsversuch {attempt}", self)
-        attempt_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        attempt_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(attempt_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # Device info
-        device_info_text = [
-            f"Gerät: {device_info.get('Hostname', 'Unknown')}",
-            f"IP-Adresse: {device_info.get('IpAddress', 'Unknown')}"
-        ]
-        info_label = QLabel("\n".join(device_info_text), self)
-        info_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        info_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_label)
+        with _UpdatesOff(self):
+            self._connecting_server_label.setText(f"Server: {server_url}")
+            self._connecting_attempt_label.setText(f"Verbindungsversuch {attempt}")
 
-        layout.addSpacing(self.large_spacing)
+            # Device info
+            self._connecting_info_label.setText(self._TEXT_DEVICE_INFO.format(
+                device_info.get('Hostname', 'Unknown'),
+                device_info.get('IpAddress', 'Unknown')
+            ))
 
-        # QR Code with connection info
-        try:
-            import json
+            # QR Code with connection info
             qr_data = json.dumps({
                 "server": server_url,
                 "hostname": device_info.get('Hostname', 'Unknown'),
                 "ip": device_info.get('IpAddress', 'Unknown'),
                 "status": "connecting",
                 "attempt": attempt
-            }, indent=2)
-
-            qr_widget = self._create_qr_code(qr_data, self.qr_size)
-            if qr_widget:
-                layout.addWidget(qr_widget)
-                qr_label = QLabel("Verbindungsinformationen (QR-Code scannen)", self)
-                qr_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.small_font_size}pt;")
-                qr_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(qr_label)
-        except Exception as e:
-            logger.warning(f"Failed to create QR code: {e}")
+            }, separators=QR_JSON_SEPARATORS)
+            self._set_qr_code(self._connecting_qr_label, self._connecting_qr_caption, qr_data)
 
-        layout.addStretch()
+            self._show_panel(self._panel_connecting)
+        self._present()
 
-        self.setLayout(layout)
-        self.update()
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
-
-        logger.info(f"STATUS SCREEN: Connecting (attempt {attempt})")
+        logger.info("STATUS SCREEN: Connecting (attempt %s)", attempt)
 
     def show_no_layout_assigned(self, client_id: str, server_url: str, device_info: Dict[str, Any]):
         """
@@ -335,64 +869,16 @@ class StatusScreen(QWidget):
         Shown when successfully connected to server but no layout is assigned
         QR code: Server URL + device ID + IP for admin to assign layout
         """
-        layout = self._create_layout()
-
-        # Warning icon
-        warning_icon = QLabel("⚠", self)
-        warning_icon.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.icon_font_size}pt; font-weight: bold;")
-        warning_icon.setAlignment(Qt.AlignCenter)
-        layout.addWidget(warning_icon)
-
-        # Title
-        title_label = QLabel("Kein Layout zugewiesen", self)
-        title_label.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.title_font_size}pt; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-
-        # Message
-        message_label = QLabel("Dieses Gerät ist verbunden, aber es wurde noch kein Layout zugewiesen", self)
-        message_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.subtitle_font_size}pt;")
-        message_label.setAlignment(Qt.AlignCenter)
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # Device info
-        device_info_text = [
-            f"Client-ID: {client_id}",
-            f"Hostname: {device_info.get('Hostname', 'Unknown')}",
-            f"IP-Adresse: {device_info.get('IpAddress', 'Unknown')}",
-            f"Server: {server_url}"
-        ]
-        info_label = QLabel("\n".join(device_info_text), self)
-        info_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        info_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # Instructions
-        instructions = [
-            "Administrator-Anweisungen:",
-            "1. Am Digital Signage Management Server anmelden",
-            "2. Zu Geräteverwaltung navigieren",
-            "3. Dieses Gerät anhand der Client-ID oder IP-Adresse finden",
-            "4. Ein Layout diesem Gerät zuweisen"
-        ]
-        instructions_label = QLabel("\n".join(instructions), self)
-        instructions_label.setStyleSheet(
-            f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt; "
-            f"background-color: #2A2A2A; padding: {self.padding}px; border-radius: 10px;"
-        )
-        instructions_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(instructions_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # QR Code with device assignment info
-        try:
-            import json
+        with _UpdatesOff(self):
+            # Device info
+            self._no_layout_info_label.setText(self._TEXT_NO_LAYOUT_INFO.format(
+                client_id,
+                device_info.get('Hostname', 'Unknown'),
+                device_info.get('IpAddress', 'Unknown'),
+                server_url
+            ))
+
+            # QR Code with device assignment info
             qr_data = json.dumps({
                 "client_id": client_id,
                 "hostname": device_info.get('Hostname', 'Unknown'),
@@ -400,175 +886,51 @@ class StatusScreen(QWidget):
                 "server": server_url,
                 "status": "no_layout_assigned",
                 "action": "Assign layout to this device"
-            }, indent=2)
-
-            qr_widget = self._create_qr_code(qr_data, self.qr_size)
-            if qr_widget:
-                layout.addWidget(qr_widget)
-                qr_label = QLabel("Geräteinformationen für Layout-Zuweisung (QR-Code scannen)", self)
-                qr_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.small_font_size}pt;")
-                qr_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(qr_label)
-        except Exception as e:
-            logger.warning(f"Failed to create QR code: {e}")
-
-        layout.addStretch()
+            }, separators=QR_JSON_SEPARATORS)
+            self._set_qr_code(self._no_layout_qr_label, self._no_layout_qr_caption, qr_data)
 
-        self.setLayout(layout)
-        self.update()
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+            self._show_panel(self._panel_no_layout)
+        self._present()
 
         logger.info("STATUS SCREEN: No Layout Assigned")
 
     def show_default_status(self):
         """Show default connection status when no specific state is active"""
         try:
-            layout = self._create_layout()
-
-            # Spinner
-            spinner = SpinnerWidget(self.spinner_size, self.COLOR_PRIMARY, self)
-            spinner_container = QWidget()
-            spinner_layout = QHBoxLayout(spinner_container)
-            spinner_layout.addStretch()
-            spinner_layout.addWidget(spinner)
-            spinner_layout.addStretch()
-            layout.addWidget(spinner_container)
-            self.animated_widgets.append(spinner)
-
-            # Title with animated dots
-            title_label = AnimatedDotsLabel("Verbindung wird hergestellt", self)
-            title_label.setStyleSheet(f"color: {self.COLOR_PRIMARY}; font-size: {self.title_font_size}pt; font-weight: bold;")
-            title_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(title_label)
-            self.animated_widgets.append(title_label)
-
-            layout.addSpacing(self.large_spacing)
-
-            # Logo (if available)
-            import os
-            logo_path = os.path.join(os.path.dirname(__file__), 'digisign-logo.png')
-            if os.path.exists(logo_path):
-                logo_label = QLabel(self)
-                pixmap = QPixmap(logo_path)
-                # Scale to 30% of screen size
-                scaled = pixmap.scaled(
-                    int(self.screen_width * 0.3),
-                    int(self.screen_height * 0.3),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                logo_label.setPixmap(scaled)
-                logo_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(logo_label)
-
-            layout.addStretch()
-
-            self.setLayout(layout)
-            self.update()
-            self.showFullScreen()
-            self.raise_()
-            self.activateWindow()
+            with _UpdatesOff(self):
+                self._show_panel(self._panel_default)
+            self._present()
 
             logger.info("STATUS SCREEN: Default Connection Status")
         except Exception as e:
-            logger.error(f"Error showing default status: {e}", exc_info=True)
+            logger.error("Error showing default status: %s", e, exc_info=True)
 
     def show_connection_failed(self, error_message: str):
         """Show connection failed status with error details"""
         try:
-            layout = self._create_layout()
-
-            # Error icon
-            error_icon = QLabel("✗", self)
-            error_icon.setStyleSheet(f"color: {self.COLOR_ERROR}; font-size: {self.icon_font_size}pt; font-weight: bold;")
-            error_icon.setAlignment(Qt.AlignCenter)
-            layout.addWidget(error_icon)
-
-            # Title
-            title_label = QLabel("Verbindung fehlgeschlagen", self)
-            title_label.setStyleSheet(f"color: {self.COLOR_ERROR}; font-size: {self.title_font_size}pt; font-weight: bold;")
-            title_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(title_label)
-
-            layout.addSpacing(self.spacing)
-
-            # Error message
-            error_label = QLabel(error_message, self)
-            error_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.subtitle_font_size}pt;")
-            error_label.setAlignment(Qt.AlignCenter)
-            error_label.setWordWrap(True)
-            layout.addWidget(error_label)
-
-            layout.addSpacing(self.large_spacing)
-
-            # Retry message
-            retry_label = QLabel("Automatische Wiederverbindung läuft...", self)
-            retry_label.setStyleSheet(f"color: {self.COLOR_TEXT_PRIMARY}; font-size: {self.body_font_size}pt;")
-            retry_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(retry_label)
-
-            layout.addStretch()
+            with _UpdatesOff(self):
+                self._failed_error_label.setText(error_message)
 
-            self.setLayout(layout)
-            self.update()
-            self.showFullScreen()
-            self.raise_()
-            self.activateWindow()
+                self._show_panel(self._panel_connection_failed)
+            self._present()
 
-            logger.info(f"STATUS SCREEN: Connection Failed - {error_message}")
+            logger.info("STATUS SCREEN: Connection Failed - %s", error_message)
         except Exception as e:
-            logger.error(f"Error showing connection failed status: {e}", exc_info=True)
+            logger.error("Error showing connection failed status: %s", e, exc_info=True)
 
     def show_reconnecting(self, attempt: int, max_attempts: int, retry_in: int):
         """Show reconnecting status with attempt counter and countdown"""
         try:
-            layout = self._create_layout()
-
-            # Spinner (orange for reconnecting)
-            spinner = SpinnerWidget(self.spinner_size, self.COLOR_WARNING, self)
-            spinner_container = QWidget()
-            spinner_layout = QHBoxLayout(spinner_container)
-            spinner_layout.addStretch()
-            spinner_layout.addWidget(spinner)
-            spinner_layout.addStretch()
-            layout.addWidget(spinner_container)
-            self.animated_widgets.append(spinner)
-
-            # Title
-            title_label = AnimatedDotsLabel("Erneuter Verbindungsversuch", self)
-            title_label.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.title_font_size}pt; font-weight: bold;")
-            title_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(title_label)
-            self.animated_widgets.append(title_label)
-
-            layout.addSpacing(self.spacing)
-
-            # Attempt counter
-            attempt_label = QLabel(f"Versuch {attempt} von {max_attempts}", self)
-            attempt_label.setStyleSheet(f"color: {self.COLOR_TEXT_PRIMARY}; font-size: {self.subtitle_font_size}pt;")
-            attempt_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(attempt_label)
-
-            # Countdown
-            if retry_in > 0:
-                countdown_label = QLabel(f"Nächster Versuch in {retry_in} Sekunden", self)
-                countdown_label.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.subtitle_font_size}pt; font-weight: bold;")
-                countdown_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(countdown_label)
-
-            layout.addStretch()
-
-            self.setLayout(layout)
-            self.update()
-            self.showFullScreen()
-            self.raise_()
-            self.activateWindow()
+            with _UpdatesOff(self):
+                self._reconnecting_attempt_label.setText(f"Versuch {attempt} von {max_attempts}")
 
-            logger.info(f"STATUS SCREEN: Reconnecting (attempt {attempt}/{max_attempts}, retry in {retry_in}s)")
+                self._show_panel(self._panel_reconnecting)
+                self._show_countdown(retry_in)
+            self._present()
+
+            logger.info("STATUS SCREEN: Reconnecting (attempt %s/%s, retry in %ss)", attempt, max_attempts, retry_in)
         except Exception as e:
-            logger.error(f"Error showing reconnecting status: {e}", exc_info=True)
+            logger.error("Error showing reconnecting status: %s", e, exc_info=True)
 
     def show_server_offline(self, server_url: str, retry_info: Dict[str, Any], device_info: Dict[str, Any], auto_discovery_active: bool):
         """
@@ -576,197 +938,275 @@ class StatusScreen(QWidget):
         Shown when server is disconnected/unreachable
         QR code: Last known server URL + retry info + auto-discovery status
         """
-        layout = self._create_layout()
-
-        # Spinner (orange for warning)
-        spinner = SpinnerWidget(self.spinner_size, self.COLOR_WARNING, self)
-        spinner_container = QWidget()
-        spinner_layout = QHBoxLayout(spinner_container)
-        spinner_layout.addStretch()
-        spinner_layout.addWidget(spinner)
-        spinner_layout.addStretch()
-        layout.addWidget(spinner_container)
-        self.animated_widgets.append(spinner)
-
-        # Title
-        title_label = QLabel("Server Offline", self)
-        title_label.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.title_font_size}pt; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-
-        # Searching/reconnecting message with animated dots
-        if auto_discovery_active:
-            reconnect_label = AnimatedDotsLabel("Suche Server im Netzwerk", self)
-        else:
-            reconnect_label = AnimatedDotsLabel("Verbindung wird wiederhergestellt", self)
-
-        reconnect_label.setStyleSheet(f"color: {self.COLOR_TEXT_PRIMARY}; font-size: {self.subtitle_font_size}pt;")
-        reconnect_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(reconnect_label)
-        self.animated_widgets.append(reconnect_label)
-
-        layout.addSpacing(self.spacing)
-
-        # Last known server
-        server_label = QLabel(f"Letzter bekannter Server: {server_url}", self)
-        server_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        server_label.setAlignment(Qt.AlignCenter)
-        server_label.setWordWrap(True)
-        layout.addWidget(server_label)
-
-        # Retry info
-        attempt = retry_info.get('attempt', 0)
-        retry_in = retry_info.get('retry_in', 0)
-
-        if retry_in > 0:
-            retry_label = QLabel(f"Nächster Versuch in {retry_in} Sekunden", self)
-            retry_label.setStyleSheet(f"color: {self.COLOR_WARNING}; font-size: {self.subtitle_font_size}pt; font-weight: bold;")
-            retry_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(retry_label)
-
-        attempt_label = QLabel(f"Verbindungsversuch {attempt}", self)
-        attempt_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        attempt_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(attempt_label)
-
-        layout.addSpacing(self.large_spacing)
-
-        # Auto-discovery status
-        if auto_discovery_active:
-            discovery_label = QLabel("✓ Auto-Discovery Aktiv", self)
-            discovery_label.setStyleSheet(f"color: {self.COLOR_SUCCESS}; font-size: {self.body_font_size}pt;")
-        else:
-            discovery_label = QLabel("Auto-Discovery Deaktiviert", self)
-            discovery_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        discovery_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(discovery_label)
-
-        # Device info
-        device_info_text = [
-            f"Gerät: {device_info.get('Hostname', 'Unknown')}",
-            f"IP-Adresse: {device_info.get('IpAddress', 'Unknown')}"
-        ]
-        info_label = QLabel("\n".join(device_info_text), self)
-        info_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        info_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_label)
-
-        layout.addSpacing(self.spacing)
-
-        # Info message
-        info_message = QLabel("Automatische Wiederverbindung läuft\nKeine Aktion erforderlich", self)
-        info_message.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.body_font_size}pt;")
-        info_message.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_message)
-
-        layout.addSpacing(self.large_spacing)
-
-        # QR Code with reconnection info
-        try:
-            import json
+        with _UpdatesOff(self):
+            # Searching/reconnecting message with animated dots
+            if auto_discovery_active:
+                reconnect_text = "Suche Server im Netzwerk"
+            else:
+                reconnect_text = "Verbindung wird wiederhergestellt"
+            if self._offline_reconnect_label.base_text != reconnect_text:
+                self._offline_reconnect_label.set_base_text(reconnect_text)
+
+            # Last known server
+            self._offline_server_label.setText(f"Letzter bekannter Server: {server_url}")
+
+            # Retry info
+            attempt = retry_info.get('attempt', 0)
+            retry_in = retry_info.get('retry_in', 0)
+
+            self._offline_attempt_label.setText(f"Verbindungsversuch {attempt}")
+
+            # Auto-discovery status
+            if auto_discovery_active:
+                self._offline_discovery_label.setText("✓ Auto-Discovery Aktiv")
+                self._set_label_style(self._offline_discovery_label, 'body_success')
+            else:
+                self._offline_discovery_label.setText("Auto-Discovery Deaktiviert")
+                self._set_label_style(self._offline_discovery_label, 'body_secondary')
+
+            # Device info
+            self._offline_info_label.setText(self._TEXT_DEVICE_INFO.format(
+                device_info.get('Hostname', 'Unknown'),
+                device_info.get('IpAddress', 'Unknown')
+            ))
+
+            # QR Code with reconnection info
             qr_data = json.dumps({
                 "server": server_url,
                 "hostname": device_info.get('Hostname', 'Unknown'),
                 "ip": device_info.get('IpAddress', 'Unknown'),
                 "status": "server_offline",
                 "attempt": attempt,
-                "retry_in_seconds": retry_in,
                 "auto_discovery": auto_discovery_active
-            }, indent=2)
-
-            qr_widget = self._create_qr_code(qr_data, self.qr_size)
-            if qr_widget:
-                layout.addWidget(qr_widget)
-                qr_label = QLabel("Wiederverbindungsinformationen (QR-Code scannen)", self)
-                qr_label.setStyleSheet(f"color: {self.COLOR_TEXT_SECONDARY}; font-size: {self.small_font_size}pt;")
-                qr_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(qr_label)
-        except Exception as e:
-            logger.warning(f"Failed to create QR code: {e}")
+            }, separators=QR_JSON_SEPARATORS)
+            self._set_qr_code(self._offline_qr_label, self._offline_qr_caption, qr_data)
+
+            self._show_panel(self._panel_server_offline)
+            self._show_countdown(retry_in)
+        self._present()
+
+        logger.info("STATUS SCREEN: Server Offline (attempt %s, retry in %ss, auto-discovery: %s)",
+                    attempt, retry_in, auto_discovery_active)
+
+    def update_countdown(self, retry_in: int):
+        """Update only the retry countdown of the visible screen (no other widget is touched)
+
+        PERFORMANCE: Throttled - the first update is shown at once, bursts within
+        COUNTDOWN_THROTTLE after it are collapsed into one update with the latest value
+        """
+        if self._countdown_timer.isActive():
+            self._pending_countdown = retry_in
+            return
+
+        self._show_countdown(retry_in)
+        self._countdown_timer.start()
 
-        layout.addStretch()
+    def _flush_countdown(self):
+        """Show the latest countdown that arrived while updates were throttled"""
+        if self._pending_countdown is not None:
+            retry_in, self._pending_countdown = self._pending_countdown, None
+            self.update_countdown(retry_in)
 
-        self.setLayout(layout)
-        self.update()
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+    def _cancel_countdown(self):
+        """Drop a throttled countdown update"""
+        self._countdown_timer.stop()
+        self._pending_countdown = None
 
-        logger.info(f"STATUS SCREEN: Server Offline (attempt {attempt}, retry in {retry_in}s, auto-discovery: {auto_discovery_active})")
+    def _show_countdown(self, retry_in: int):
+        """Set the countdown label of the visible screen"""
+        label = self._countdown_labels.get(self._active_panel)
+        if label is None:
+            return
+        label.setText(f"Nächster Versuch in {retry_in} Sekunden")
+        label.setVisible(retry_in > 0)
 
 
-class StatusScreenManager:
+# Seconds a resolved device IP address is reused before it is looked up again
+IP_CACHE_TTL = 30
+
+
+class StatusScreenManager(QObject):
     """
     Manager for status screens with proper state machine
 
     REDESIGNED ARCHITECTURE (2025):
     - Exactly 4 screen states (AUTO_DISCOVERY, CONNECTING, NO_LAYOUT_ASSIGNED, SERVER_OFFLINE)
-    - Thread-safe state transitions with lock
-    - Single entry point per state with all required parameters
+    - Thread-safe: transitions requested from other threads are queued to the Qt main thread
+    - Single entry point (set_state) - show_* are thin wrappers around it
+    - State + context diffing: unchanged screens are not touched at all
     - Atomic state changes to prevent race conditions
     """
 
+    # Requested transition: (state, context) - delivered to _transition on the Qt main thread
+    _state_requested = pyqtSignal(object, object)
+
+    # Background IP lookup finished with a new address - delivered on the Qt main thread
+    _ip_changed = pyqtSignal()
+
+    # States whose screens show device info - it is part of their diffed context
+    DEVICE_INFO_STATES = (
+        ScreenState.AUTO_DISCOVERY,
+        ScreenState.CONNECTING,
+        ScreenState.NO_LAYOUT_ASSIGNED,
+        ScreenState.SERVER_OFFLINE,
+    )
+
+    # How each state is rendered from its context: (status screen, context) -> None
+    _RENDERERS = {
+        ScreenState.AUTO_DISCOVERY: lambda screen, c: screen.show_auto_discovery(c['device_info']),
+        ScreenState.CONNECTING: lambda screen, c: screen.show_connecting(
+            c['server_url'], c['attempt'], c['device_info']),
+        ScreenState.NO_LAYOUT_ASSIGNED: lambda screen, c: screen.show_no_layout_assigned(
+            c['client_id'], c['server_url'], c['device_info']),
+        ScreenState.SERVER_OFFLINE: lambda screen, c: screen.show_server_offline(
+            c['server_url'], {'attempt': c['attempt'], 'retry_in': c['retry_in']},
+            c['device_info'], c['auto_discovery_active']),
+        ScreenState.DEFAULT_STATUS: lambda screen, c: screen.show_default_status(),
+        ScreenState.CONNECTION_FAILED: lambda screen, c: screen.show_connection_failed(c['error_message']),
+        ScreenState.RECONNECTING: lambda screen, c: screen.show_reconnecting(
+            c['attempt'], c['max_attempts'], c['retry_in']),
+    }
+
     def __init__(self, display_renderer, client=None):
         """Initialize status screen manager"""
+        super().__init__()
         self.display_renderer = display_renderer
         self.client = client
 
-        # State management with lock for thread safety
-        self._state_lock = threading.Lock()
+        # State management - only touched on the Qt main thread (see set_state)
         self._current_state = ScreenState.NONE
+        self._current_context = {}
+        # Last state asked for by set_state - may still be queued to the main thread
+        self._requested_state = ScreenState.NONE
+        self._state_requested.connect(self._transition)
+
+        # Device IP address cache - resolved in a background thread because
+        # DeviceManager.get_ip_address() may block on socket/DNS calls
+        self._cached_ip = None
+        self._ip_resolved_at = 0.0
+        self._ip_lookup_running = False
+        self._ip_changed.connect(self._on_ip_changed)
 
-        # Keep-alive timer
-        self._keep_alive_timer = None
+        # Screen size is read once - it does not change at runtime on a kiosk display
+        self._screen_size = self._detect_screen_size()
 
         # Create status screen immediately (eager creation)
         logger.info("Creating status screen immediately (eager creation)...")
+        self.status_screen = self._create_status_screen(*self._screen_size)
+        logger.info("Status screen created eagerly: %dx%d", *self._screen_size)
+
+        screen = QApplication.primaryScreen()
+        if screen:
+            screen.geometryChanged.connect(lambda _geometry: self.invalidate_screen_geometry())
 
-        from PyQt5.QtWidgets import QApplication
+    def _detect_screen_size(self) -> tuple:
+        """Get the primary screen size (falls back to the display renderer size)"""
         screen = QApplication.primaryScreen()
         if screen:
             screen_geometry = screen.geometry()
-            width = screen_geometry.width()
-            height = screen_geometry.height()
-        else:
-            width = display_renderer.width()
-            height = display_renderer.height()
-
-        self.status_screen = StatusScreen(width, height, parent=None)
-
-        self.status_screen.setWindowFlags(
-            Qt.Window |
-            Qt.FramelessWindowHint |
-            Qt.WindowStaysOnTopHint
-        )
+            return screen_geometry.width(), screen_geometry.height()
+        return self.display_renderer.width(), self.display_renderer.height()
+
+    def _create_status_screen(self, width: int, height: int) -> StatusScreen:
+        """Create the fullscreen status screen window (kept behind until a state is shown)"""
+        status_screen = StatusScreen(width, height, parent=None)
+
+        # Window setup without intermediate paints - the window appears in one frame
+        with _UpdatesOff(status_screen):
+            status_screen.setWindowFlags(
+                Qt.Window |
+                Qt.FramelessWindowHint |
+                Qt.WindowStaysOnTopHint
+            )
+
+            status_screen.showFullScreen()
+            status_screen.lower()  # Put behind initially
+
+        return status_screen
 
-        self.status_screen.setGeometry(0, 0, width, height)
-        self.status_screen.showFullScreen()
-        self.status_screen.lower()  # Put behind initially
+    def invalidate_screen_geometry(self):
+        """Re-read the screen size and rebuild the status screen if it changed"""
+        screen_size = self._detect_screen_size()
+        if screen_size == self._screen_size or self.status_screen is None:
+            return
 
-        logger.info(f"Status screen created eagerly: {width}x{height}")
+        logger.info("Screen geometry changed: %dx%d -> %dx%d", *self._screen_size, *screen_size)
+        self._screen_size = screen_size
+
+        # Font sizes and spacings are scaled at construction - build a new screen
+        old_screen = self.status_screen
+        self.status_screen = self._create_status_screen(*screen_size)
+        old_screen.clear_screen()
+        old_screen.deleteLater()
+
+        # Re-render the active state on the new screen
+        state = self._current_state
+        context = self._without_device_info(self._current_context)
+        self._current_state = ScreenState.NONE
+        self._current_context = {}
+        if state != ScreenState.NONE:
+            self._transition(state, context)
 
     def set_client(self, client):
         """Set the client reference after initialization"""
         self.client = client
         logger.debug("Client reference set in StatusScreenManager")
 
+        # Resolve the IP address early so the first status screen can show it
+        self._refresh_ip_address()
+
     @property
     def is_showing_status(self) -> bool:
-        """Check if any status screen is currently shown"""
-        with self._state_lock:
-            return self._current_state != ScreenState.NONE
+        """Check if any status screen is currently shown (or requested to be shown)"""
+        return self._requested_state != ScreenState.NONE
+
+    def _refresh_ip_address(self):
+        """Start a background IP lookup unless one is running or the cache is fresh"""
+        if self._ip_lookup_running:
+            return
+        if self._cached_ip is not None and time.monotonic() - self._ip_resolved_at < IP_CACHE_TTL:
+            return
+        if not (self.client and hasattr(self.client, 'device_manager')
+                and hasattr(self.client.device_manager, 'get_ip_address')):
+            return
+
+        def lookup():
+            try:
+                ip_address = self.client.device_manager.get_ip_address()
+                changed = ip_address != self._cached_ip
+                self._cached_ip = ip_address
+                self._ip_resolved_at = time.monotonic()
+                if changed:
+                    logger.debug("Device IP address resolved: %s", ip_address)
+                    self._ip_changed.emit()
+            except Exception as e:
+                logger.warning("Failed to resolve IP address: %s", e)
+            finally:
+                self._ip_lookup_running = False
+
+        self._ip_lookup_running = True
+        threading.Thread(target=lookup, name="status-ip-lookup", daemon=True).start()
+
+    def _on_ip_changed(self):
+        """Re-render the shown screen with the new IP address (text and QR code)"""
+        if self._current_state in self.DEVICE_INFO_STATES:
+            self._transition(self._current_state, self._without_device_info(self._current_context))
+
+    def _get_ip_address(self) -> str:
+        """Get the cached device IP address (never blocks the UI thread)"""
+        self._refresh_ip_address()
+        return self._cached_ip if self._cached_ip is not None else 'Wird ermittelt...'
 
     def _get_device_info(self) -> Dict[str, Any]:
         """Get device info from client (thread-safe)"""
         try:
             if self.client and hasattr(self.client, 'device_manager'):
-                import asyncio
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
                     # Can't await in sync context - use cached info
                     return {
                         'Hostname': 'Unknown',
-                        'IpAddress': self.client.device_manager.get_ip_address() if hasattr(self.client.device_manager, 'get_ip_address') else 'Unknown',
+                        'IpAddress': self._get_ip_address() if hasattr(self.client.device_manager, 'get_ip_address') else 'Unknown',
                         'MacAddress': 'Unknown'
                     }
                 else:
@@ -774,127 +1214,140 @@ class StatusScreenManager:
                     return asyncio.run(self.client.device_manager.get_device_info())
             return {'Hostname': 'Unknown', 'IpAddress': 'Unknown', 'MacAddress': 'Unknown'}
         except Exception as e:
-            logger.warning(f"Failed to get device info: {e}")
+            logger.warning("Failed to get device info: %s", e)
             return {'Hostname': 'Unknown', 'IpAddress': 'Unknown', 'MacAddress': 'Unknown'}
 
     def show_auto_discovery(self):
-        """Show auto-discovery screen (Screen 1)
-
-        ANTI-FLICKER: Checks state and device info before recreation
-        """
-        with self._state_lock:
-            device_info = self._get_device_info()
-
-            # ANTI-FLICKER FIX: Check if already showing with same data
-            if self._current_state == ScreenState.AUTO_DISCOVERY:
-                # Already showing auto-discovery - check if device info changed
-                if hasattr(self, '_last_device_info') and self._last_device_info == device_info:
-                    logger.debug("Already showing auto-discovery screen with same device info - skipping recreation to prevent flicker")
-                    return
-                else:
-                    logger.debug("Auto-discovery screen active but device info changed - will update")
-
-            logger.info("STATE TRANSITION: %s -> AUTO_DISCOVERY", self._current_state.value)
-            self._current_state = ScreenState.AUTO_DISCOVERY
-            self._last_device_info = device_info.copy() if device_info else {}
-
-            self._clear_display_renderer()
-            self.status_screen.show_auto_discovery(device_info)
-            self._start_keep_alive_timer()
+        """Show auto-discovery screen (Screen 1)"""
+        self.set_state(ScreenState.AUTO_DISCOVERY)
 
     def show_connecting(self, server_url: str, attempt: int = 1):
         """Show connecting screen (Screen 2)"""
-        with self._state_lock:
-            # Allow updates for attempt counter
-            logger.info("STATE TRANSITION: %s -> CONNECTING (attempt %d)", self._current_state.value, attempt)
-            self._current_state = ScreenState.CONNECTING
-
-            self._clear_display_renderer()
-            device_info = self._get_device_info()
-            self.status_screen.show_connecting(server_url, attempt, device_info)
-            self._start_keep_alive_timer()
+        self.set_state(ScreenState.CONNECTING, server_url=server_url, attempt=attempt)
 
     def show_no_layout_assigned(self, client_id: str, server_url: str):
         """Show no layout assigned screen (Screen 3)"""
-        with self._state_lock:
-            if self._current_state == ScreenState.NO_LAYOUT_ASSIGNED:
-                logger.debug("Already showing no layout assigned screen - skipping")
-                return
-
-            logger.info("STATE TRANSITION: %s -> NO_LAYOUT_ASSIGNED", self._current_state.value)
-            self._current_state = ScreenState.NO_LAYOUT_ASSIGNED
-
-            self._clear_display_renderer()
-            device_info = self._get_device_info()
-            self.status_screen.show_no_layout_assigned(client_id, server_url, device_info)
-            self._start_keep_alive_timer()
+        self.set_state(ScreenState.NO_LAYOUT_ASSIGNED, client_id=client_id, server_url=server_url)
 
     def show_server_offline(self, server_url: str, attempt: int = 0, retry_in: int = 0, auto_discovery_active: bool = False):
         """Show server offline screen (Screen 4)"""
-        with self._state_lock:
-            # Allow updates for countdown
-            logger.info("STATE TRANSITION: %s -> SERVER_OFFLINE (attempt %d, retry %ds)", self._current_state.value, attempt, retry_in)
-            self._current_state = ScreenState.SERVER_OFFLINE
+        self.set_state(ScreenState.SERVER_OFFLINE, server_url=server_url, attempt=attempt,
+                       retry_in=retry_in, auto_discovery_active=auto_discovery_active)
+
+    async def show_server_offline_async(self, server_url: str, attempt: int, retry_in: int,
+                                        auto_discovery_active: bool = False,
+                                        should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """Show the server offline screen and count the retry delay down once per second
 
-            self._clear_display_renderer()
-            device_info = self._get_device_info()
-            retry_info = {'attempt': attempt, 'retry_in': retry_in}
-            self.status_screen.show_server_offline(server_url, retry_info, device_info, auto_discovery_active)
-            self._start_keep_alive_timer()
+        Yields to the event loop between seconds; each step only updates the countdown label.
+        Returns False if should_stop() ended the countdown early.
+        """
+        for remaining in range(retry_in, 0, -1):
+            if should_stop and should_stop():
+                return False
+            self.show_server_offline(server_url, attempt, remaining, auto_discovery_active)
+            await asyncio.sleep(1)
+        return True
 
     def show_default_status(self):
         """Show default connection status (fallback when state is unclear)"""
-        with self._state_lock:
-            logger.info("STATE TRANSITION: %s -> DEFAULT_STATUS", self._current_state.value)
-            self._current_state = ScreenState.CONNECTING  # Treat as connecting state
-
-            self._clear_display_renderer()
-            self.status_screen.show_default_status()
-            self._start_keep_alive_timer()
+        self.set_state(ScreenState.DEFAULT_STATUS)
 
     def show_connection_failed(self, error_message: str):
         """Show connection failed screen with error details"""
-        with self._state_lock:
-            logger.info("STATE TRANSITION: %s -> CONNECTION_FAILED", self._current_state.value)
-            self._current_state = ScreenState.SERVER_OFFLINE  # Treat as server offline
-
-            self._clear_display_renderer()
-            self.status_screen.show_connection_failed(error_message)
-            self._start_keep_alive_timer()
+        self.set_state(ScreenState.CONNECTION_FAILED, error_message=error_message)
 
     def show_reconnecting(self, attempt: int, max_attempts: int, retry_in: int):
         """Show reconnecting screen with progress"""
-        with self._state_lock:
-            logger.info("STATE TRANSITION: %s -> RECONNECTING (attempt %d/%d)", self._current_state.value, attempt, max_attempts)
-            self._current_state = ScreenState.SERVER_OFFLINE  # Treat as server offline
-
-            self._clear_display_renderer()
-            self.status_screen.show_reconnecting(attempt, max_attempts, retry_in)
-            self._start_keep_alive_timer()
+        self.set_state(ScreenState.RECONNECTING, attempt=attempt, max_attempts=max_attempts, retry_in=retry_in)
 
     def clear_status_screen(self):
         """Clear the status screen and prepare for layout display"""
-        with self._state_lock:
-            if self._current_state == ScreenState.NONE:
-                logger.debug("No status screen to clear")
+        self.set_state(ScreenState.NONE)
+
+    def set_state(self, state: ScreenState, **context):
+        """Switch to a status screen state - single entry point for all show_* methods
+
+        ANTI-FLICKER: Repeating the current state with the same context is a no-op,
+        a change of only the retry countdown updates just the countdown label
+
+        Called on the Qt main thread the transition runs immediately; called from
+        any other thread (e.g. the asyncio thread without qasync) the signal is
+        queued and the transition runs on the main thread - widgets are never
+        touched from a worker thread and no lock is needed.
+        """
+        self._requested_state = state
+        self._state_requested.emit(state, context)
+
+    def _transition(self, state: ScreenState, context: Dict[str, Any]):
+        """Diff the requested state against the current one and render only what changed"""
+        if state == ScreenState.NONE:
+            self._clear()
+            return
+
+        if self.status_screen is None:
+            logger.debug("Status screen already shut down - ignoring %s", state.name)
+            return
+
+        if state in self.DEVICE_INFO_STATES:
+            context['device_info'] = self._get_device_info()
+
+        if state == self._current_state:
+            if context == self._current_context:
+                logger.debug("Already showing %s screen with same data - skipping update", state.name)
                 return
 
-            logger.info("STATE TRANSITION: %s -> NONE (clearing)", self._current_state.value)
-            self._current_state = ScreenState.NONE
+            if 'retry_in' in context and self._without_countdown(context) == self._without_countdown(self._current_context):
+                self._current_context = context
+                self.status_screen.update_countdown(context['retry_in'])
+                return
 
-            # Stop keep-alive timer
-            if self._keep_alive_timer:
-                self._keep_alive_timer.stop()
-                self._keep_alive_timer.deleteLater()
-                self._keep_alive_timer = None
+        logger.info("STATE TRANSITION: %s -> %s %s", self._current_state.name, state.name,
+                    self._without_device_info(context))
+        self._current_state = state
+        self._current_context = context
 
-            if self.status_screen:
-                try:
-                    self.status_screen.clear_screen()
-                    self.status_screen.lower()
-                    logger.debug("Status screen cleared and lowered")
-                except Exception as e:
-                    logger.warning(f"Failed to clear status screen: {e}")
+        self._clear_display_renderer()
+
+        self._RENDERERS[state](self.status_screen, context)
+
+    @staticmethod
+    def _without_device_info(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Context as passed by the caller (device info is looked up per transition)"""
+        return {k: v for k, v in context.items() if k != 'device_info'}
+
+    @staticmethod
+    def _without_countdown(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Context without the retry countdown (the only value allowed to change in place)"""
+        return {k: v for k, v in context.items() if k != 'retry_in'}
+
+    def _clear(self):
+        """Hide the status screen content (Qt main thread only)"""
+        if self._current_state == ScreenState.NONE:
+            logger.debug("No status screen to clear")
+            return
+
+        logger.info("STATE TRANSITION: %s -> NONE (clearing)", self._current_state.name)
+        self._current_state = ScreenState.NONE
+        self._current_context = {}
+
+        if self.status_screen:
+            try:
+                # Hide instead of destroying - the same widget is reused by the next show_*
+                self.status_screen.clear_screen()
+                self.status_screen.hide()
+                logger.debug("Status screen cleared and hidden")
+            except Exception as e:
+                logger.warning("Failed to clear status screen: %s", e)
+
+    def shutdown(self):
+        """Release the status screen window (client shutdown only)"""
+        self.clear_status_screen()
+
+        if self.status_screen:
+            self.status_screen.deleteLater()
+            self.status_screen = None
+            logger.debug("Status screen released")
 
     def _clear_display_renderer(self):
         """Clear the display renderer to allow status screen to be visible"""
@@ -910,40 +1363,4 @@ class StatusScreenManager:
                 self.display_renderer.clear_layout_for_status_screen()
                 logger.debug("Display renderer cleared for status screen")
         except Exception as e:
-            logger.error(f"Failed to clear display renderer: {e}")
-
-    def _start_keep_alive_timer(self):
-        """Start a timer to periodically re-raise the status screen"""
-        if self._keep_alive_timer:
-            self._keep_alive_timer.stop()
-            self._keep_alive_timer = None
-
-        from PyQt5.QtCore import QTimer
-        self._keep_alive_timer = QTimer()
-        self._keep_alive_timer.timeout.connect(self._keep_status_screen_on_top)
-        self._keep_alive_timer.start(3000)  # Every 3 seconds
-        logger.debug("Status screen keep-alive timer started")
-
-    def _keep_status_screen_on_top(self):
-        """Periodically ensure status screen stays on top
-
-        ANTI-FLICKER: Only performs minimal operations to keep window on top
-        Avoids unnecessary showFullScreen() calls that cause redraws
-        """
-        with self._state_lock:
-            if self._current_state != ScreenState.NONE and self.status_screen:
-                try:
-                    # ANTI-FLICKER FIX: Only raise/activate if not already on top
-                    # Check if window is already active before making unnecessary calls
-                    if not self.status_screen.isActiveWindow():
-                        self.status_screen.raise_()
-                        self.status_screen.activateWindow()
-                        logger.debug("Status screen raised to stay on top")
-
-                    # ANTI-FLICKER FIX: Only call showFullScreen() if actually not fullscreen
-                    # This prevents constant redraws from redundant showFullScreen() calls
-                    if not self.status_screen.isFullScreen():
-                        self.status_screen.showFullScreen()
-                        logger.debug("Status screen set to fullscreen")
-                except Exception as e:
-                    logger.warning(f"Failed to keep status screen on top: {e}")
+            logger.error("Failed to clear display renderer: %s", e)
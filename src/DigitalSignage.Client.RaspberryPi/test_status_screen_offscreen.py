@@ -0,0 +1,188 @@
+"""
+Offscreen tests for the status screen
+
+Run with: QT_QPA_PLATFORM=offscreen python3 -m pytest test_status_screen_offscreen.py
+(the platform defaults to offscreen, so no display is needed)
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtCore import QTimer, QEventLoop
+
+from status_screen import StatusScreen, StatusScreenManager
+
+DEVICE_INFO = {'Hostname': 'pi', 'IpAddress': '192.168.0.10', 'MacAddress': 'aa:bb:cc:dd:ee:ff'}
+SERVER_URL = "https://192.168.0.5:8080"
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def screen(app):
+    screen = StatusScreen(800, 600)
+    yield screen
+    screen.clear_screen()
+    StatusScreen._qr_thread_pool().waitForDone()
+    screen.deleteLater()
+    process_events(0)
+
+
+class FakeDisplayRenderer(QWidget):
+    """Display renderer stand-in - the manager only clears it for the status screen"""
+
+    def clear_layout_for_status_screen(self):
+        pass
+
+
+@pytest.fixture
+def manager(app):
+    manager = StatusScreenManager(FakeDisplayRenderer())
+    yield manager
+    StatusScreen._qr_thread_pool().waitForDone()
+    manager.shutdown()
+    process_events(0)
+
+
+def process_events(ms: int):
+    """Run the Qt event loop for the given time"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def record_calls(obj, name: str) -> list:
+    """Record the arguments of every call of a method (the method still runs)"""
+    calls = []
+    method = getattr(obj, name)
+
+    def recording_method(*args):
+        calls.append(args)
+        return method(*args)
+
+    setattr(obj, name, recording_method)
+    return calls
+
+
+def record_set_text(label) -> list:
+    """Record every text set on a label (the label still shows it)"""
+    texts = []
+    set_text = label.setText
+
+    def recording_set_text(text):
+        texts.append(text)
+        set_text(text)
+
+    label.setText = recording_set_text
+    return texts
+
+
+def show_server_offline(screen, retry_in: int):
+    screen.show_server_offline(SERVER_URL, {'attempt': 3, 'retry_in': retry_in}, DEVICE_INFO, True)
+
+
+def test_first_countdown_update_is_shown_at_once(screen):
+    show_server_offline(screen, 10)
+    texts = record_set_text(screen._offline_retry_label)
+
+    screen.update_countdown(9)
+
+    assert texts == ["Nächster Versuch in 9 Sekunden"]
+
+
+def test_countdown_burst_collapses_into_one_update_with_latest_value(screen):
+    show_server_offline(screen, 10)
+    texts = record_set_text(screen._offline_retry_label)
+
+    screen.update_countdown(9)
+    for retry_in in (8, 7, 6):
+        screen.update_countdown(retry_in)
+    assert len(texts) == 1
+
+    process_events(StatusScreen.COUNTDOWN_THROTTLE + 100)
+
+    assert texts == ["Nächster Versuch in 9 Sekunden", "Nächster Versuch in 6 Sekunden"]
+    assert screen._offline_retry_label.text() == "Nächster Versuch in 6 Sekunden"
+
+
+def test_full_show_drops_pending_countdown(screen):
+    show_server_offline(screen, 10)
+    screen.update_countdown(9)
+    screen.update_countdown(8)
+
+    show_server_offline(screen, 5)
+    process_events(StatusScreen.COUNTDOWN_THROTTLE + 100)
+
+    assert screen._offline_retry_label.text() == "Nächster Versuch in 5 Sekunden"
+
+
+def test_same_state_and_context_is_skipped(manager):
+    manager.show_server_offline(SERVER_URL, attempt=3, retry_in=10, auto_discovery_active=True)
+    renders = record_calls(manager.status_screen, 'show_server_offline')
+    countdowns = record_calls(manager.status_screen, 'update_countdown')
+
+    manager.show_server_offline(SERVER_URL, attempt=3, retry_in=10, auto_discovery_active=True)
+
+    assert renders == []
+    assert countdowns == []
+
+
+def test_retry_in_change_only_updates_countdown(manager):
+    manager.show_server_offline(SERVER_URL, attempt=3, retry_in=10, auto_discovery_active=True)
+    renders = record_calls(manager.status_screen, 'show_server_offline')
+    countdowns = record_calls(manager.status_screen, 'update_countdown')
+
+    manager.show_server_offline(SERVER_URL, attempt=3, retry_in=9, auto_discovery_active=True)
+
+    assert renders == []
+    assert countdowns == [(9,)]
+    assert manager._current_context['retry_in'] == 9
+
+
+@pytest.mark.parametrize("change", [
+    {'attempt': 4},
+    {'auto_discovery_active': False},
+    {'server_url': "https://192.168.0.6:8080"},
+    {'attempt': 4, 'retry_in': 9},
+])
+def test_other_context_change_re_renders(manager, change):
+    context = dict(server_url=SERVER_URL, attempt=3, retry_in=10, auto_discovery_active=True)
+    manager.show_server_offline(**context)
+    renders = record_calls(manager.status_screen, 'show_server_offline')
+    countdowns = record_calls(manager.status_screen, 'update_countdown')
+
+    manager.show_server_offline(**dict(context, **change))
+
+    assert len(renders) == 1
+    assert countdowns == []
+
+
+def decode_qr_image(image, modules: int) -> list:
+    """Read the module matrix back from a built QR image (sampling each module's centre)"""
+    box = image.width() // modules
+    return [[image.pixel(x * box + box // 2, y * box + box // 2) == StatusScreen.QR_FOREGROUND_RGB
+             for x in range(modules)]
+            for y in range(modules)]
+
+
+@pytest.mark.parametrize("data", [
+    b"x",
+    b"https://192.168.0.5:8080/api/devices/register?id=aa:bb:cc:dd:ee:ff&hostname=raspberrypi-lobby",
+])
+def test_qr_image_decodes_back_to_module_matrix(app, data):
+    matrix = StatusScreen._qr_matrix(data)
+    modules = len(matrix)
+    # Rows that don't fill whole bytes exercise the Format_Mono row padding
+    assert modules % 8 != 0
+
+    image = StatusScreen._build_qr_image(data, 300, StatusScreen.QR_BACKGROUND_RGB)
+
+    assert image.width() == image.height()
+    assert image.width() % modules == 0
+    assert decode_qr_image(image, modules) == [[bool(module) for module in row] for row in matrix]
@@ -4,12 +4,14 @@ Contains custom Qt widgets for rendering
 """
 
 from .shape_widget import ShapeWidget
+from .animation_driver import AnimationDriver
 from .animated_dots_label import AnimatedDotsLabel
 from .spinner_widget import SpinnerWidget
 from .screen_state import ScreenState
 
 __all__ = [
     'ShapeWidget',
+    'AnimationDriver',
     'AnimatedDotsLabel',
     'SpinnerWidget',
     'ScreenState'
@@ -4,7 +4,8 @@ Animated dots label widget for loading/progress indicators
 
 import logging
 from PyQt5.QtWidgets import QLabel
-from PyQt5.QtCore import QTimer
+
+from .animation_driver import AnimationDriver
 
 logger = logging.getLogger(__name__)
 
@@ -12,25 +13,53 @@ logger = logging.getLogger(__name__)
 class AnimatedDotsLabel(QLabel):
     """Label that animates dots (e.g., "Connecting..." becomes "Connecting." -> "Connecting.." -> "Connecting...")"""
 
+    # Time each dot step stays visible (ms)
+    INTERVAL = 600
+
     def __init__(self, base_text: str, parent=None):
         super().__init__(parent)
         self.base_text = base_text
         self.dot_count = 0
         self.max_dots = 3
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_dots)
-        self.timer.start(600)  # Update every 600ms
+        # Dots padded with spaces to a constant length, so the text width barely
+        # changes per step and the parent layout is not re-run on every tick
+        self._suffixes = ["." * n + " " * (self.max_dots - n) for n in range(self.max_dots + 1)]
+        self._texts = self._build_texts()
+        self._last_text = None
+
+        self.start()
 
+    def set_base_text(self, base_text: str):
+        """Change the animated text and restart the dots"""
+        self.base_text = base_text
+        self._texts = self._build_texts()
+        self.dot_count = 0
         self.update_dots()
 
+    def _build_texts(self) -> list:
+        """Pre-build the full text of every dot step for the current base text"""
+        return [self.base_text + suffix for suffix in self._suffixes]
+
+    def tick(self, now_ms: int):
+        """Advance the dots to the given time of the shared animation clock"""
+        dot_count = (now_ms // self.INTERVAL) % (self.max_dots + 1)
+        if dot_count != self.dot_count:
+            self.dot_count = dot_count
+            self.update_dots()
+
     def update_dots(self):
         """Update the dots animation"""
-        dots = "." * self.dot_count
-        self.setText(f"{self.base_text}{dots}")
-        self.dot_count = (self.dot_count + 1) % (self.max_dots + 1)
+        text = self._texts[self.dot_count]
+        if text != self._last_text:
+            self._last_text = text
+            self.setText(text)
+
+    def start(self):
+        """Start (or resume) animating this label"""
+        AnimationDriver.instance().subscribe(self)
+        self.update_dots()
 
     def cleanup(self):
-        """Stop the timer"""
-        if self.timer:
-            self.timer.stop()
+        """Stop animating this label"""
+        AnimationDriver.instance().unsubscribe(self)
@@ -0,0 +1,74 @@
+"""
+Shared animation clock for loading/progress indicator widgets
+"""
+
+import logging
+import weakref
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QObject, QTimer, QElapsedTimer
+
+logger = logging.getLogger(__name__)
+
+
+class AnimationDriver(QObject):
+    """Single timer that ticks every registered animated widget
+
+    Subscribers implement tick(now_ms) and derive their frame from the elapsed
+    time, so one timer can drive animations with different speeds.
+    """
+
+    # Tick interval of the shared timer (ms) - about 15 fps; smoother spinners
+    # are not noticeable on a signage display but cost a Pi repaints
+    INTERVAL = 66
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'AnimationDriver':
+        """Get the application-wide driver (created on first use)"""
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = weakref.WeakSet()
+
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+        self._timer = QTimer(self)
+        # Precise: a coarse timer drifts a few ms per tick against the clock
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def now_ms(self) -> int:
+        """Milliseconds since the driver was created"""
+        return self._clock.elapsed()
+
+    def subscribe(self, widget):
+        """Start ticking the given widget"""
+        self._subscribers.add(widget)
+        if not self._timer.isActive():
+            # Ticks land on whole multiples of INTERVAL of the clock
+            self._clock.restart()
+            self._timer.start(self.INTERVAL)
+
+    def unsubscribe(self, widget):
+        """Stop ticking the given widget (timer stops when nothing is left)"""
+        self._subscribers.discard(widget)
+        if not self._subscribers:
+            self._timer.stop()
+
+    def _tick(self):
+        """Advance every subscribed widget to the current time"""
+        now = self.now_ms()
+        for widget in list(self._subscribers):
+            try:
+                widget.tick(now)
+            except RuntimeError:
+                # Underlying C++ widget already deleted
+                self._subscribers.discard(widget)
+
+        if not self._subscribers:
+            self._timer.stop()
@@ -6,9 +6,12 @@ from enum import Enum
 
 
 class ScreenState(Enum):
-    """Enum for the 4 allowed screen states"""
+    """Enum for the 4 main screen states plus the secondary connection screens"""
     AUTO_DISCOVERY = "auto_discovery"
     CONNECTING = "connecting"
     NO_LAYOUT_ASSIGNED = "no_layout_assigned"
     SERVER_OFFLINE = "server_offline"
+    DEFAULT_STATUS = "default_status"
+    CONNECTION_FAILED = "connection_failed"
+    RECONNECTING = "reconnecting"
     NONE = "none"  # No status screen shown
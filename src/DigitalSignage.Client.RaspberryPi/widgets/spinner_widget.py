@@ -4,8 +4,10 @@ Spinner widget for loading/progress indicators
 
 import logging
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import QVariantAnimation, QEasingCurve, Qt
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap
+
+from .animation_driver import AnimationDriver
 
 logger = logging.getLogger(__name__)
 
@@ -13,55 +15,75 @@ logger = logging.getLogger(__name__)
 class SpinnerWidget(QWidget):
     """Custom spinner widget with rotating circle"""
 
+    # Rotation step between two pre-rendered frames (degrees) - 24 frames per turn.
+    # Every animation tick advances exactly one frame, so a full rotation takes
+    # 24 ticks (about 1.6 s, close to the 1.5 s of the original QVariantAnimation)
+    FRAME_STEP = 15
+
+    # Arc geometry: pen width and inset of the arc from the widget edge
+    PEN_WIDTH = 6
+    ARC_INSET = 5
+
     def __init__(self, size: int = 80, color: str = "#4A90E2", parent=None):
         super().__init__(parent)
         self.setFixedSize(size, size)
+        # Frames are transparent outside the arc - no background erase needed
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self._angle = 0
         self.color = QColor(color)
 
-        self.animation = QVariantAnimation(self)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(360)
-        self.animation.setDuration(1500)
-        self.animation.setLoopCount(-1)
-        self.animation.setEasingCurve(QEasingCurve.Linear)
-        self.animation.valueChanged.connect(self._on_angle_changed)
-        self.animation.start()
+        self._pen = QPen(self.color)
+        self._pen.setWidth(self.PEN_WIDTH)
+        self._pen.setCapStyle(Qt.RoundCap)
+
+        # Only the ring covered by the stroked arc ever changes between frames
+        pad = self.ARC_INSET - self.PEN_WIDTH // 2
+        self._arc_bounding_rect = QRect(0, 0, size, size).adjusted(pad, pad, -pad, -pad)
+
+        radius = size // 2 - self.ARC_INSET
+        self._arc_rect = QRect(size // 2 - radius, size // 2 - radius, 2 * radius, 2 * radius)
+
+        # PERFORMANCE: Render every rotation step once instead of stroking
+        # the antialiased arc on each animation tick
+        self._frames = [self._render_arc(angle) for angle in range(0, 360, self.FRAME_STEP)]
+
+        self.start()
 
-    def _on_angle_changed(self, value):
-        """Handle angle change from animation"""
-        self._angle = value
-        self.update()
+    def _render_arc(self, angle: int) -> QPixmap:
+        """Render the spinner arc at the given start angle into a transparent pixmap"""
+        pixmap = QPixmap(self.width(), self.height())
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        painter.setPen(self._pen)
+        painter.drawArc(self._arc_rect, angle * 16, 270 * 16)
+        painter.end()
+        return pixmap
+
+    def tick(self, now_ms: int):
+        """Advance the spinner to the given time of the shared animation clock"""
+        # Rounded to the nearest tick - timer jitter never skips or repeats a frame
+        frame = round(now_ms / AnimationDriver.INTERVAL) % len(self._frames)
+        angle = frame * self.FRAME_STEP
+        if angle != self._angle:
+            self._angle = angle
+            self.update(self._arc_bounding_rect)
 
     def paintEvent(self, event):
-        """Draw the spinner"""
+        """Draw the pre-rendered frame for the current angle"""
+        if not event.region().intersects(self._arc_bounding_rect):
+            return
+
+        index = (self._angle // self.FRAME_STEP) % len(self._frames)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-
-        rect = self.rect()
-        center_x = rect.width() / 2
-        center_y = rect.height() / 2
-        radius = min(center_x, center_y) - 5
-
-        pen = QPen(self.color)
-        pen.setWidth(6)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
-
-        start_angle = self._angle * 16
-        span_angle = 270 * 16
-
-        painter.drawArc(
-            int(center_x - radius),
-            int(center_y - radius),
-            int(radius * 2),
-            int(radius * 2),
-            start_angle,
-            span_angle
-        )
+        painter.drawPixmap(0, 0, self._frames[index])
+
+    def start(self):
+        """Start (or resume) the animation"""
+        AnimationDriver.instance().subscribe(self)
 
     def cleanup(self):
         """Stop the animation"""
-        if self.animation:
-            self.animation.stop()
+        AnimationDriver.instance().unsubscribe(self)